@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Dict, Sequence, Tuple, Optional
+from typing import Dict, List, Sequence, Tuple, Optional
 
 
 class CountVectorizer:
@@ -59,6 +59,33 @@ class CountVectorizer:
 
         return [_create(d) for d in documents]
 
+    @staticmethod
+    def _index_documents(
+        documents: Sequence[Sequence[str]],
+    ) -> Tuple[Sequence[Sequence[str]], List[int]]:
+        """Map each document to the index of its first occurrence in a list of
+        distinct documents.
+
+        Training data contains every prefix of every production, hence mostly
+        repeated documents; features then only need to be extracted once per
+        distinct document.
+
+        Parameters
+        ----------
+        documents : Sequence[Sequence[str]]
+            Sequence of documents tokenized as sequence of string
+
+        Returns
+        -------
+        Tuple[Sequence[Sequence[str]], List[int]]
+            The distinct documents and for each document its index in those.
+        """
+        doc_ids: Dict[Tuple[str, ...], int] = {}
+        index = [
+            doc_ids.setdefault(tuple(document), len(doc_ids)) for document in documents
+        ]
+        return list(doc_ids), index
+
     @staticmethod
     def _get_feature_counts(
         ngram_range: Tuple[int, int], documents: Sequence[Sequence[str]]
@@ -75,21 +102,22 @@ class CountVectorizer:
 
         Returns
         -------
-        Tuple[Sequence[Dict[str, int]], Set[str]]
-            For each document a dictionary counting how often which feature appeared and
-            a set of all features in all documents. Features are according to this
-            vectorizers n-gram settings.
+        Sequence[Dict[str, int]]
+            For each document a dictionary counting how often which feature appeared.
+            Features are according to this vectorizers n-gram settings. Identical
+            documents share the same dictionary.
         """
-        documents = CountVectorizer._create_ngrams(ngram_range, documents)
+        unique_documents, index = CountVectorizer._index_documents(documents)
+        unique_documents = CountVectorizer._create_ngrams(ngram_range, unique_documents)
         count_matrix = []
 
-        for document in documents:
+        for document in unique_documents:
             # This is 5x faster than using a build in Counter
             feature_counts: Dict[str, int] = defaultdict(int)
             for feature in document:
                 feature_counts[feature] += 1
             count_matrix.append(feature_counts)
-        return count_matrix
+        return [count_matrix[i] for i in index]
 
     @staticmethod
     def _build_vocabulary(count_matrix: Sequence[Dict[str, int]]) -> Dict[str, int]:
@@ -5,6 +5,7 @@ from typing import (
     cast,
     Callable,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Optional,
@@ -19,7 +20,7 @@ import regex
 from itertools import chain
 
 from .partial_parse import PartialParse
-from .rule import _regex as global_regex
+from .rule import _regex as global_regex, _regex_literals as global_regex_literals
 from .scorer import Scorer
 from .timers import CTParseTimeoutError, timeit
 
@@ -178,7 +179,7 @@ def _ctparse(
 
         logger.debug("=" * 80)
         logger.debug("-> matching regular expressions")
-        p, _tp = timeit(_match_regex)(txt, global_regex)
+        p, _tp = timeit(_match_regex)(txt, global_regex, global_regex_literals)
         logger.debug("time in _match_regex: {:.0f}ms".format(1000 * _tp))
 
         logger.debug("=" * 80)
@@ -191,8 +192,8 @@ def _ctparse(
         # TODO: the score should be kept separate from the partial parse
         # because it depends also on the text and the ts. A good idea is
         # to create a namedtuple of kind StackElement(partial_parse, score)
-        for pp in stack:
-            pp.score = scorer.score(txt, ts, pp)
+        for pp, score in zip(stack, scorer.score_batch(txt, ts, stack)):
+            pp.score = score
 
         logger.debug("initial stack length: {}".format(len(stack)))
         # sort stack by length of covered string and - if that is equal - score
@@ -341,13 +342,28 @@ def _match_rule(
         i_s += 1
 
 
-def _match_regex(txt: str, regexes: Dict[int, regex.Regex]) -> List[RegexMatch]:
+def _match_regex(
+    txt: str,
+    regexes: Dict[int, regex.Regex],
+    literals: Optional[Dict[int, Optional[FrozenSet[str]]]] = None,
+) -> List[RegexMatch]:
     # Match a collection of regexes in *txt*
     #
     # The returned RegexMatch objects are sorted by the start of the match
     # :param txt: the text to match against
     # :param regexes: a collection of regexes name->pattern
+    # :param literals: optionally, for each regex name, a set of casefolded
+    #                  literals of which any match contains at least one;
+    #                  regexes none of whose literals occur in txt are skipped
     # :return: a list of RegexMatch objects ordered my RegexMatch.mstart
+    if literals:
+        folded = txt.casefold()
+        candidates = {}
+        for name, pattern in regexes.items():
+            lits = literals.get(name)
+            if lits is None or any(lit in folded for lit in lits):
+                candidates[name] = pattern
+        regexes = candidates
     matches = {
         RegexMatch(name, m)
         for name, re in regexes.items()
@@ -1,9 +1,7 @@
 """Utility to load default model in ctparse"""
 
-import bz2
 import logging
 import os
-import pickle
 
 from .scorer import Scorer, DummyScorer
 from .nb_scorer import NaiveBayesScorer
@@ -21,9 +19,7 @@ def load_default_scorer() -> Scorer:
     """
     if os.path.exists(DEFAULT_MODEL_FILE):
         logger.info("Loading model from {}".format(DEFAULT_MODEL_FILE))
-        with bz2.open(DEFAULT_MODEL_FILE, "rb") as fd:
-            mdl = pickle.load(fd)
-        return NaiveBayesScorer(mdl)
+        return NaiveBayesScorer.from_model_file(DEFAULT_MODEL_FILE)
 
     else:
         logger.warning("No model found, initializing empty scorer")
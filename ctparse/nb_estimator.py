@@ -93,6 +93,30 @@ class MultinomialNaiveBayes:
         self.log_likelihood = self._construct_log_likelihood(X, y, self.alpha)
         return self
 
+    def log_odds(self) -> Tuple[float, List[float]]:
+        """Log-odds of the positive class split into prior and feature weights
+
+        Since there are only two classes, log P(1|X) - log P(-1|X) is the
+        difference of the class log priors plus, for each feature, its count
+        times the difference of the class log-likelihoods. The normalization of
+        the posterior cancels.
+
+        Returns
+        -------
+        Tuple[float, List[float]]
+            Difference of the (positive, negative) class log priors and for each
+            feature index the difference of the class log-likelihoods
+        """
+        prior_delta = self.class_prior[1] - self.class_prior[0]
+        delta = [
+            pos - neg
+            for pos, neg in zip(
+                self.log_likelihood.get("positive_class", []),
+                self.log_likelihood.get("negative_class", []),
+            )
+        ]
+        return prior_delta, delta
+
     def predict_log_probability(
         self, X: Sequence[Dict[int, int]]
     ) -> Sequence[Tuple[float, float]]:
@@ -3,7 +3,7 @@ import bz2
 import math
 import pickle
 from datetime import datetime
-from typing import Sequence
+from typing import Any, Dict, Sequence, Tuple
 
 from ctparse.nb_estimator import MultinomialNaiveBayes
 from ctparse.count_vectorizer import CountVectorizer
@@ -25,28 +25,50 @@ class NaiveBayesScorer(Scorer):
         cover a smaller part of the text string.
 
         :param nb_model:
-            A scikit-learn style Estimator that was trained on a corpus that takes
-            a Sequence[Sequence[str]] as X (each entry is a sequence of rule
+            A CTParsePipeline of a CountVectorizer and a MultinomialNaiveBayes
+            (see train_naive_bayes), trained on a corpus that takes a
+            Sequence[Sequence[str]] as X (each entry is a sequence of rule
             identifiers) and a Sequence[int] in the set {-1, 1} that indicates if
-            the parse was correct or incorrect.
+            the parse was correct or incorrect. The n-gram weights are read from
+            the vocabulary and ngram_range of its transformer and the log_odds of
+            its estimator.
         """
         self._model = nb_model
 
+        # Unpack the pipeline once: the score is the logit
+        # log P(1|X) - log P(-1|X), i.e. the prior log-odds plus the sum of the
+        # log-odds weights of all n-gram features.
+        vectorizer = nb_model.transformer
+        self._prior_delta, delta = nb_model.estimator.log_odds()
+        self._ngram_range = vectorizer.ngram_range
+        # Map each n-gram directly to its weight, a single lookup at score time
+        self._weights = {
+            ngram: delta[idx] for ngram, idx in (vectorizer.vocabulary or {}).items()
+        }
+        # Memo of _score_last_rule by the last max_n rules
+        self._window_scores: Dict[Tuple[str, ...], float] = {}
+
     @classmethod
     def from_model_file(cls, fname: str) -> "NaiveBayesScorer":
-        with bz2.open(fname, "rb") as fd:
-            return cls(pickle.load(fd))
+        """Load a model saved with save_naive_bayes.
+
+        The compression (bz2, zstandard or none) is detected from the file
+        content.
+        """
+        mdl = _load_model(fname)
+        if isinstance(mdl, cls):
+            # a pickled scorer, possibly from an older version: rebuild it from its
+            # pipeline
+            mdl = mdl._model
+        return cls(mdl)
 
     def score(self, txt: str, ts: datetime, partial_parse: PartialParse) -> float:
         # Penalty for partial matches
         max_covered_chars = partial_parse.prod[-1].mend - partial_parse.prod[0].mstart
         len_score = math.log(max_covered_chars / len(txt))
 
-        X = _feature_extractor(txt, ts, partial_parse)
-        pred = self._model.predict_log_proba([X])
-
         # NOTE: the prediction is log-odds, or logit
-        model_score = pred[0][1] - pred[0][0]
+        model_score = self._model_score(txt, ts, partial_parse)
 
         return model_score + len_score
 
@@ -58,22 +80,83 @@ class NaiveBayesScorer(Scorer):
         # production
         len_score = math.log(len(prod) / len(txt))
 
-        X = _feature_extractor(txt, ts, partial_parse)
-        pred = self._model.predict_log_proba([X])
-
         # NOTE: the prediction is log-odds, or logit
-        model_score = pred[0][1] - pred[0][0]
+        model_score = self._model_score(txt, ts, partial_parse)
 
         # We want the len_score to always take precedence. I believe a logit won't go up
         # more than 1000. A better way would be to return an ordering tuple instead,
         # but then we would need to change many interfaces.
         return model_score + 1000 * len_score
 
+    def _model_score(
+        self, txt: str, ts: datetime, partial_parse: PartialParse
+    ) -> float:
+        # The model score only depends on the rules, hence it is computed once
+        # per partial parse and, if this scorer scored the parent parse,
+        # incrementally from the parent's log-odds
+        logodds = partial_parse.nb_logodds
+        if logodds is None or partial_parse.nb_scorer is not self:
+            X = _feature_extractor(txt, ts, partial_parse)
+            parent_logodds = partial_parse.parent_nb_logodds
+            if parent_logodds is None or partial_parse.parent_nb_scorer is not self:
+                logodds = self._score_rules(X)
+            else:
+                logodds = parent_logodds + self._score_window(X)
+            partial_parse.nb_logodds = logodds
+            partial_parse.nb_scorer = self
+        return self._prior_delta + logodds
+
+    def _score_window(self, rules: Sequence[str]) -> float:
+        # The n-grams ending at the last rule only depend on the last max_n
+        # rules. There are few distinct such windows, so the sum of their
+        # weights is computed once per window and then looked up.
+        window = tuple(rules[-self._ngram_range[1] :])
+        score = self._window_scores.get(window)
+        if score is None:
+            if len(self._window_scores) >= _MAX_WINDOW_SCORES:
+                self._window_scores.clear()
+            score = self._window_scores[window] = self._score_last_rule(window)
+        return score
+
+    def _score_last_rule(self, rules: Sequence[str]) -> float:
+        """Sum the log-likelihood differences of the n-grams ending at the last
+        element of rules, i.e. those not yet contained in rules[:-1]
+        """
+        min_n, max_n = self._ngram_range
+        weights = self._weights
+        n_rules = len(rules)
+        score = 0.0
+        for n in range(min_n, min(max_n, n_rules) + 1):
+            score += weights.get(" ".join(rules[n_rules - n :]), 0.0)
+        return score
+
+    def _score_rules(self, rules: Sequence[str]) -> float:
+        """Sum the log-likelihood differences of all n-grams of rules
+
+        Equivalent to vectorizing rules with the pipeline's CountVectorizer and
+        taking the dot product with the log-likelihood differences, without
+        building the intermediate count dictionaries. N-grams not in the
+        vocabulary have weight zero.
+
+        The n-grams are grouped by the rule they end at, so that the n-grams of
+        each window of max_n rules are only generated once and then looked up.
+        """
+        max_n = self._ngram_range[1]
+        score_window = self._score_window
+        rules = tuple(rules)
+        score = 0.0
+        for end in range(1, len(rules) + 1):
+            score += score_window(rules[max(0, end - max_n) : end])
+        return score
+
+
+_MAX_WINDOW_SCORES = 100000
+
 
 def _feature_extractor(
     txt: str, ts: datetime, partial_parse: PartialParse
 ) -> Sequence[str]:
-    return [str(r) for r in partial_parse.rules]
+    return partial_parse.rule_strs
 
 
 def train_naive_bayes(X: Sequence[Sequence[str]], y: Sequence[bool]) -> CTParsePipeline:
@@ -88,7 +171,35 @@ def train_naive_bayes(X: Sequence[Sequence[str]], y: Sequence[bool]) -> CTParseP
 
 
 def save_naive_bayes(model: CTParsePipeline, fname: str) -> None:
-    """Save a naive bayes model for NaiveBayesScorer"""
+    """Save a naive bayes model for NaiveBayesScorer
+
+    Models are bz2 compressed, unless fname ends in ``.zst``, in which case they
+    are compressed with zstandard (requires the ``zstandard`` package).
+    """
     # TODO: version this model and dump metadata with lots of information
-    with bz2.open(fname, "wb") as fd:
-        pickle.dump(model, fd)
+    if str(fname).endswith(".zst"):
+        import zstandard
+
+        with open(fname, "wb") as fd:
+            fd.write(zstandard.ZstdCompressor().compress(pickle.dumps(model)))
+    else:
+        with bz2.open(fname, "wb") as fd:
+            pickle.dump(model, fd)
+
+
+_BZ2_MAGIC = b"BZh"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _load_model(fname: str) -> Any:
+    # Dispatch on the magic bytes, so that the file name does not matter and
+    # uncompressed pickles can be loaded as well
+    with open(fname, "rb") as fd:
+        data = fd.read()
+    if data.startswith(_BZ2_MAGIC):
+        data = bz2.decompress(data)
+    elif data.startswith(_ZSTD_MAGIC):
+        import zstandard
+
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return pickle.loads(data)
@@ -12,7 +12,7 @@ from typing import (
     Generator,
 )
 
-from .rule import rules as global_rules, ProductionRule, Predicate
+from .rule import rules as global_rules, _regex_tok, ProductionRule, Predicate
 from .timers import timeit
 from .types import Artifact, RegexMatch
 
@@ -22,8 +22,24 @@ T = TypeVar("T")
 
 
 class PartialParse:
+    __slots__ = (
+        "prod",
+        "rules",
+        "rule_strs",
+        "applicable_rules",
+        "max_covered_chars",
+        "score",
+        "nb_logodds",
+        "nb_scorer",
+        "parent_nb_logodds",
+        "parent_nb_scorer",
+    )
+
     def __init__(
-        self, prod: Tuple[Artifact, ...], rules: Tuple[Union[int, str], ...]
+        self,
+        prod: Tuple[Artifact, ...],
+        rules: Tuple[Union[int, str], ...],
+        rule_strs: Optional[Tuple[str, ...]] = None,
     ) -> None:
         """A data structure representing a partial parse.
 
@@ -31,16 +47,33 @@ class PartialParse:
         * prod: the current partial production
         * rules: the sequence of regular expressions and rules used/applied to produce
                  prod
+        * rule_strs: the string representation of rules, computed from rules if
+                     not given
+        * max_covered_chars: the length of the span covered by prod
         * score: the score assigned to this production
+
+        Scorers may store the sum of the naive bayes n-gram log-odds of rules in
+        nb_logodds, together with themselves in nb_scorer, as the value is only
+        valid for the scorer that computed it. Parses created via apply_rule
+        carry both values of their parent in parent_nb_logodds and
+        parent_nb_scorer, so that only the n-grams ending at the newly applied
+        rule need to be added.
         """
         if len(prod) < 1:
             raise ValueError("prod should have at least one element")
 
         self.prod = prod
         self.rules = rules
+        if rule_strs is None:
+            rule_strs = tuple(str(r) for r in rules)
+        self.rule_strs = rule_strs
         self.applicable_rules = global_rules
         self.max_covered_chars = self.prod[-1].mend - self.prod[0].mstart
         self.score = 0.0
+        self.nb_logodds = None  # type: Optional[float]
+        self.nb_scorer = None  # type: Optional[object]
+        self.parent_nb_logodds = None  # type: Optional[float]
+        self.parent_nb_scorer = None  # type: Optional[object]
 
     @classmethod
     def from_regex_matches(
@@ -52,7 +85,11 @@ class PartialParse:
         regex matches) have been applied.
 
         """
-        se = cls(prod=regex_matches, rules=tuple(r.id for r in regex_matches))
+        se = cls(
+            prod=regex_matches,
+            rules=tuple(r.id for r in regex_matches),
+            rule_strs=tuple(_regex_tok.get(r.id) or str(r.id) for r in regex_matches),
+        )
 
         logger.debug("=" * 80)
         logger.debug("-> checking rule applicability")
@@ -74,7 +111,7 @@ class PartialParse:
         self,
         ts: datetime,
         rule: ProductionRule,
-        rule_name: Union[str, int],
+        rule_name: str,
         match: Tuple[int, int],
     ) -> Optional["PartialParse"]:
         """Check whether the production in rule can be applied to this stack
@@ -86,7 +123,7 @@ class PartialParse:
 
         :param ts: reference time
         :param rule: a tuple where the first element is the production rule to apply
-        :param rule_name: the name of the rule
+        :param rule_name: the name of the rule, also used as its naive bayes feature
         :param match: the start and end index of the parameters that the rule needs.
         """
         prod = rule(ts, *self.prod[match[0] : match[1]])
@@ -95,9 +132,12 @@ class PartialParse:
             pp = PartialParse(
                 prod=self.prod[: match[0]] + (prod,) + self.prod[match[1] :],
                 rules=self.rules + (rule_name,),
+                rule_strs=self.rule_strs + (rule_name,),
             )
 
             pp.applicable_rules = self.applicable_rules
+            pp.parent_nb_logodds = self.nb_logodds
+            pp.parent_nb_scorer = self.nb_scorer
             return pp
         else:
             return None
@@ -2,10 +2,27 @@
 import logging
 
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, Type
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    Type,
+)
 
 import regex
 
+try:
+    from re import _parser as sre_parse  # type: ignore  # Python >= 3.11
+except ImportError:  # pragma: no cover
+    import sre_parse
+
 from .types import Artifact, RegexMatch
 
 logger = logging.getLogger(__name__)
@@ -26,6 +43,12 @@ _regex_cnt = 100  # leave this much space for ids of production types
 _regex = {}  # compiled regex
 _regex_str = {}  # map regex id to original string
 _str_regex = {}  # type: Dict[str, int] # map regex raw str to regex id
+# map regex id to its token in the naive bayes features, created once so that all
+# partial parses share the same string object (and its cached hash)
+_regex_tok = {}  # type: Dict[int, str]
+# map regex id to a set of (casefolded) literals of which each match contains at
+# least one, or None if unknown
+_regex_literals = {}  # type: Dict[int, Optional[FrozenSet[str]]]
 
 _regex_hour = r"(?:[01]?\d)|(?:2[0-3])"
 _regex_minute = r"[0-5]\d"
@@ -75,6 +98,8 @@ def rule(*patterns: Union[str, Predicate]) -> Callable[[Any], ProductionRule]:
             if new_rr.match(""):
                 raise ValueError("expression {} matches empty strings".format(p))
             _regex_str[_regex_cnt] = p
+            _regex_tok[_regex_cnt] = str(_regex_cnt)
+            _regex_literals[_regex_cnt] = _required_literals(p)
             _str_regex[p] = _regex_cnt
             _regex[_regex_cnt] = new_rr
             _regex_cnt += 1
@@ -98,6 +123,7 @@ def rule(*patterns: Union[str, Predicate]) -> Callable[[Any], ProductionRule]:
     mapped_patterns = [_map(p) for p in patterns]
 
     def fwrapper(f: ProductionRule) -> ProductionRule:
+        @wraps(f)
         def wrapper(ts: datetime, *args: Artifact) -> Optional[Artifact]:
             res = f(ts, *args)
             if res is not None:
@@ -112,6 +138,103 @@ def rule(*patterns: Union[str, Predicate]) -> Callable[[Any], ProductionRule]:
     return fwrapper
 
 
+_ZERO_WIDTH = {sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT}
+_REPEATS = {
+    getattr(sre_parse, op)
+    for op in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_parse, op)
+}
+
+
+def _required_literals(p: str) -> Optional[FrozenSet[str]]:
+    """Determine a set of literals of which every match of the regular expression p
+    contains at least one (compared casefolded), to cheaply rule out expressions
+    that cannot match a text. Returns None if no such set can be determined, e.g.
+    because p uses syntax specific to the regex module.
+    """
+    if not _is_plain_re(p):
+        return None
+    try:
+        parsed = sre_parse.parse(p)
+    except Exception:
+        return None
+    return _seq_literals(list(parsed))
+
+
+# Repeats understood by re, any other "{" is regex module syntax (e.g. fuzzy
+# matching) that re would silently read as a literal
+_re_repeat = regex.compile(r"\{(?:\d+(?:,\d*)?|,\d+)\}")
+
+
+def _is_plain_re(p: str) -> bool:
+    # Check that p only uses syntax that re parses the same way as the regex
+    # module in VERSION1 mode, i.e. no fuzzy matching, nested sets or set
+    # operations
+    i = 0
+    in_set = False
+    while i < len(p):
+        c = p[i]
+        if c == "\\":
+            i += 2
+            continue
+        if in_set:
+            if c == "[" or p[i : i + 2] in ("--", "&&", "||", "~~"):
+                return False
+            if c == "]":
+                in_set = False
+        elif c == "[":
+            in_set = True
+            # a leading "^" negates, a "]" right after is a literal
+            if p[i + 1 : i + 2] == "^":
+                i += 1
+            if p[i + 1 : i + 2] == "]":
+                i += 1
+        elif c == "{" and not _re_repeat.match(p, i):
+            return False
+        i += 1
+    return True
+
+
+def _seq_literals(items: Sequence[Tuple[Any, Any]]) -> Optional[FrozenSet[str]]:
+    # Collect candidate literal sets from the mandatory parts of the sequence and
+    # keep the most selective one, i.e. the one with the longest shortest literal
+    candidates = []
+    run = []  # type: List[str]
+
+    def _end_run() -> None:
+        if run:
+            candidates.append(frozenset(["".join(run).casefold()]))
+            del run[:]
+
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if op in _ZERO_WIDTH:
+            # does not consume characters, the literal run continues
+            continue
+        _end_run()
+        sub = None  # type: Optional[FrozenSet[str]]
+        if op is sre_parse.SUBPATTERN:
+            sub = _seq_literals(list(av[-1]))
+        elif op is getattr(sre_parse, "ATOMIC_GROUP", None):
+            sub = _seq_literals(list(av))
+        elif op is sre_parse.BRANCH:
+            alternatives = [_seq_literals(list(a)) for a in av[1]]
+            if all(a is not None for a in alternatives):
+                sub = frozenset().union(*alternatives)  # type: ignore
+        elif op in _REPEATS and av[0] >= 1:
+            sub = _seq_literals(list(av[2]))
+        if sub:
+            candidates.append(sub)
+    _end_run()
+
+    candidates = [c for c in candidates if all(c)]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda c: (min(len(lit) for lit in c), -len(c)))
+
+
 def regex_match(r_id: int) -> Predicate:
     def _regex_match(r: Artifact) -> bool:
         return type(r) == RegexMatch and r.id == r_id  # type: ignore
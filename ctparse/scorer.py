@@ -5,7 +5,7 @@ implement scoring strategies for ctparse.
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
 from random import Random
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from .partial_parse import PartialParse
 from .types import Artifact
@@ -35,6 +35,20 @@ class Scorer(metaclass=ABCMeta):
         :param prod: the production
         """
 
+    def score_batch(
+        self, txt: str, ts: datetime, partial_parses: Sequence[PartialParse]
+    ) -> List[float]:
+        """Produce a score for each of several partial productions.
+
+        The default implementation calls score for each partial parse; scorers
+        can override this to amortize per-call overhead.
+
+        :param txt: the text that is being parsed
+        :param ts: the reference time
+        :param partial_parses: the partial parses that need to be scored
+        """
+        return [self.score(txt, ts, pp) for pp in partial_parses]
+
 
 class DummyScorer(Scorer):
     """A scorer that always return a 0.0 score."""
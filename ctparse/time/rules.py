@@ -1,7 +1,8 @@
 from typing import Optional, Any, cast
-from datetime import datetime
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
-from dateutil.rrule import rrule, MONTHLY
 from ..rule import rule, predicate, dimension, _regex_to_join
 from ..types import Time, Duration, Interval, pod_hours, RegexMatch, DurationUnit, Recurring, RecurringFrequency, \
     RecurringArray
@@ -29,8 +30,11 @@ _dows = [
     ("sat", r"\bsamstag\b|\bsonnabends?\b|\bsaturday\b|\bsat\.?\b"),
     ("sun", r"\bsonntag\b|\bso\.?\b|\bsunday\b|\bsun\.?\b"),
 ]
+# Alternatives are whole words and hence mutually exclusive; atomic groups stop
+# the regex engine from backtracking into the alternation when the rest of an
+# enclosing pattern fails.
 _rule_dows = r"|".join(r"(?P<{}>{})".format(dow, expr) for dow, expr in _dows)
-_rule_dows = r"({})\s*".format(_rule_dows)
+_rule_dows = r"(?>{})\s*".format(_rule_dows)
 
 
 @rule(_rule_dows)
@@ -56,6 +60,7 @@ _months = [
     ("december", r"\bdecember\b|\bdezember\b|\bdez\.?\b|\bdec\.?\b"),
 ]
 _rule_months = "|".join(r"(?P<{}>{})".format(name, expr) for name, expr in _months)
+_rule_months = r"(?>{})".format(_rule_months)
 
 
 @rule(_rule_months)
@@ -82,14 +87,15 @@ _named_ts = (
     (12, r"\btwelve\b|\bzwölf\b"),
 )
 _rule_named_ts = "|".join(r"(?P<t_{}>{})".format(n, expr) for n, expr in _named_ts)
-_rule_named_ts = r"({})\s*".format(_rule_named_ts)
+_rule_named_ts = r"(?>{})\s*".format(_rule_named_ts)
+_named_ts_groups = [("t_{}".format(n), n) for n, _ in _named_ts]
 
 
 @rule(_rule_named_ts + r"(uhr|h|o\'?clock)?")
 def ruleNamedHour(ts: datetime, m: RegexMatch) -> Optional[Time]:
     match = m.match
-    for n, _, in _named_ts:
-        if match.group("t_{}".format(n)):
+    for group, n in _named_ts_groups:
+        if match.group(group):
             return Time(hour=n, minute=0)
     return None
 
@@ -146,6 +152,7 @@ _pods = [
 ]
 
 _rule_pods = "|".join("(?P<{}>{})".format(pod, expr) for pod, expr in _pods)
+_rule_pods = r"(?>{})".format(_rule_pods)
 
 
 @rule(_rule_pods)
@@ -221,32 +228,31 @@ def ruleNow(ts: datetime, _: RegexMatch) -> Time:
 
 @rule(r"morgen|tmrw?|tomm?or?rows?")
 def ruleTomorrow(ts: datetime, _: RegexMatch) -> Time:
-    dm = ts + relativedelta(days=1)
+    dm = ts + timedelta(days=1)
     return Time(year=dm.year, month=dm.month, day=dm.day)
 
 
 @rule(r"übermorgen")
 def ruleAfterTomorrow(ts: datetime, _: RegexMatch) -> Time:
-    dm = ts + relativedelta(days=2)
+    dm = ts + timedelta(days=2)
     return Time(year=dm.year, month=dm.month, day=dm.day)
 
 
 @rule(r"gestern|yesterdays?")
 def ruleYesterday(ts: datetime, _: RegexMatch) -> Time:
-    dm = ts + relativedelta(days=-1)
+    dm = ts - timedelta(days=1)
     return Time(year=dm.year, month=dm.month, day=dm.day)
 
 
 @rule(r"vor\s?gestern")
 def ruleBeforeYesterday(ts: datetime, _: RegexMatch) -> Time:
-    dm = ts + relativedelta(days=-2)
+    dm = ts - timedelta(days=2)
     return Time(year=dm.year, month=dm.month, day=dm.day)
 
 
 @rule(r"(das )?ende (des|dieses) monats?|(the )?(\bEOM\b|end of (the )?month)")
 def ruleEOM(ts: datetime, _: RegexMatch) -> Time:
-    dm = ts + relativedelta(day=1, months=1, days=-1)
-    return Time(year=dm.year, month=dm.month, day=dm.day)
+    return Time(year=ts.year, month=ts.month, day=monthrange(ts.year, ts.month)[1])
 
 
 @rule(
@@ -254,8 +260,7 @@ def ruleEOM(ts: datetime, _: RegexMatch) -> Time:
     r"(the )?(\bEOY\b|end of (the )?year)"
 )
 def ruleEOY(ts: datetime, _: RegexMatch) -> Time:
-    dm = ts + relativedelta(day=1, month=1, years=1, days=-1)
-    return Time(year=dm.year, month=dm.month, day=dm.day)
+    return Time(year=ts.year, month=12, day=31)
 
 
 @rule(predicate("isDOM"), predicate("isMonth"))
@@ -307,11 +312,24 @@ def ruleDOWPOD(ts: datetime, dow: Time, pod: Time) -> Time:
     return Time(DOW=dow.DOW, POD=pod.POD)
 
 
+def _next_dow_dom(ts: datetime, dow: int, dom: int) -> date:
+    # First date on or after ts that is on weekday dow and day of month dom
+    year, month = ts.year, ts.month
+    while True:
+        if dom <= monthrange(year, month)[1]:
+            dm = date(year, month, dom)
+            if dm.weekday() == dow and dm >= ts.date():
+                return dm
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+
 @rule(predicate("isDOW"), predicate("isDOM"))
 def ruleDOWDOM(ts: datetime, dow: Time, dom: Time) -> Time:
     # Monday 5th
     # Find next date at this day of week and day of month
-    dm = rrule(MONTHLY, dtstart=ts, byweekday=dow.DOW, bymonthday=dom.day, count=1)[0]
+    dm = _next_dow_dom(ts, dow.DOW, dom.day)
     return Time(year=dm.year, month=dm.month, day=dm.day)
 
 
@@ -337,11 +355,19 @@ def ruleLatentDOM(ts: datetime, dom: Time) -> Time:
     return Time(year=dm.year, month=dm.month, day=dm.day)
 
 
-@rule(predicate("isDOW"))
-def ruleLatentDOW(ts: datetime, dow: Time) -> Time:
-    dm = ts + relativedelta(weekday=dow.DOW)
+@lru_cache(maxsize=128)
+def _next_dow(ts: datetime, dow: int) -> datetime:
+    # Next date strictly after ts that falls on weekday dow; rules applied
+    # during the search ask for the same (ts, dow) many times
+    dm: datetime = ts + relativedelta(weekday=dow)
     if dm <= ts:
         dm += relativedelta(weeks=1)
+    return dm
+
+
+@rule(predicate("isDOW"))
+def ruleLatentDOW(ts: datetime, dow: Time) -> Time:
+    dm = _next_dow(ts, dow.DOW)
     return Time(year=dm.year, month=dm.month, day=dm.day)
 
 
@@ -415,6 +441,12 @@ def ruleDDMMYYYY(ts: datetime, m: RegexMatch) -> Time:
     return Time(year=y, month=month, day=int(m.match.group("day")))
 
 
+@lru_cache(maxsize=16)
+def _year_in_three_months(ts: datetime) -> int:
+    in_three_months: datetime = ts + relativedelta(months=3)
+    return in_three_months.year
+
+
 def _is_valid_military_time(ts: datetime, t: Time) -> bool:
     if t.hour is None or t.minute is None:
         return False
@@ -428,7 +460,7 @@ def _is_valid_military_time(ts: datetime, t: Time) -> bool:
     if t_year == ts.year:
         return False
     # If hhmm is the year in 3 month from now -> same, prefer year
-    if t_year == (ts + relativedelta(months=3)).year:
+    if t_year == _year_in_three_months(ts):
         return False
     # If the minutes is not a multiple of 5 prefer year.
     # Since military times are typically used for flights,
@@ -1076,7 +1108,7 @@ _recurring_dows = [
     ("sun", r"\bsonntags\b|\bsos\.?\b|\bsundays\b|\bsuns\.?\b"),
 ]
 _rule_recurring_dows = r"|".join(r"(?P<{}>{})".format(dow, expr) for dow, expr in _recurring_dows)
-_rule_recurring_dows = r"({})\s*".format(_rule_recurring_dows)
+_rule_recurring_dows = r"(?>{})\s*".format(_rule_recurring_dows)
 
 
 @rule(_rule_single_frequencies)
@@ -1254,9 +1286,7 @@ def ruleRecurringTimeInterval2(ts: datetime, t: Interval, r: Recurring) -> Optio
 @rule(r"(every|each)\s*", predicate("isDOW"))
 def ruleRecurringDOW(ts: datetime, m: RegexMatch, dow: Time) -> Optional[Recurring]:
     # every thursday
-    dm = ts + relativedelta(weekday=dow.DOW)
-    if dm <= ts:
-        dm += relativedelta(weeks=1)
+    dm = _next_dow(ts, dow.DOW)
     time = Time(year=dm.year, month=dm.month, day=dm.day, DOW=dow.DOW)
     return Recurring(frequency='weekly', interval=1, start_time=time, end_time=time)
 
@@ -1269,9 +1299,7 @@ def ruleRecurringIntervalDOW(ts: datetime, m: RegexMatch, dow: Time) -> Optional
         match = m.match.group("n_{}".format(i))
         if match:
             itv = i
-    dm = ts + relativedelta(weekday=dow.DOW)
-    if dm <= ts:
-        dm += relativedelta(weeks=1)
+    dm = _next_dow(ts, dow.DOW)
     time = Time(year=dm.year, month=dm.month, day=dm.day, DOW=dow.DOW)
     return Recurring(frequency='weekly', interval=itv, start_time=time, end_time=time)
 
@@ -1282,9 +1310,7 @@ def ruleRecurringDOWS(ts: datetime, m: RegexMatch) -> Optional[Recurring]:
     for i, (name, _) in enumerate(_recurring_dows):
         if m.match.group(name):
             dow = i
-            dm = ts + relativedelta(weekday=dow)
-            if dm <= ts:
-                dm += relativedelta(weeks=1)
+            dm = _next_dow(ts, dow)
             time = Time(year=dm.year, month=dm.month, day=dm.day, DOW=dow)
             return Recurring(frequency="weekly", interval=1, start_time=time, end_time=time)
     return None
@@ -1301,15 +1327,11 @@ def ruleRecurringSimpleDOWDOW(ts: datetime, rec1: Recurring, m: RegexMatch, rec2
 @rule(r"(every|each)\s*", predicate("isDOW"), r"(and)\s*", predicate("isDOW"))
 def ruleRecurringDOWDOW(ts: datetime, m1: RegexMatch, dow1: Time, m2: RegexMatch, dow2: Time) -> Optional[Recurring]:
     # every thursday and wednesday
-    dm = ts + relativedelta(weekday=dow1.DOW)
-    if dm <= ts:
-        dm += relativedelta(weeks=1)
+    dm = _next_dow(ts, dow1.DOW)
     time1 = Time(year=dm.year, month=dm.month, day=dm.day, DOW=dow1.DOW)
     rec_1 = Recurring(frequency='weekly', interval=1, start_time=time1, end_time=time1)
 
-    dm2 = ts + relativedelta(weekday=dow2.DOW)
-    if dm2 <= ts:
-        dm2 += relativedelta(weeks=1)
+    dm2 = _next_dow(ts, dow2.DOW)
     time2 = Time(year=dm2.year, month=dm2.month, day=dm2.day, DOW=dow2.DOW)
     rec_2 = Recurring(frequency='weekly', interval=1, start_time=time2, end_time=time2)
 
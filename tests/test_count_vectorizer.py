@@ -42,3 +42,15 @@ def test_count_vectorizer_transform_no_fit():
     cv = CountVectorizer((1, 2))
     with pytest.raises(ValueError):
         cv.transform([["a"]])
+
+
+def test_count_vectorizer_repeated_documents():
+    docs = [["a", "b"], ["b"], ["a", "b"]]
+    assert CountVectorizer._index_documents(docs) == ([("a", "b"), ("b",)], [0, 1, 0])
+
+    cv = CountVectorizer((1, 2))
+    X = cv.fit_transform(docs)
+    vocabulary = cv.vocabulary
+    assert vocabulary is not None
+    assert X[2] == {vocabulary["a"]: 1, vocabulary["b"]: 1, vocabulary["a b"]: 1}
+    assert X[2] is not X[0]
@@ -18,6 +18,7 @@ def test_partial_parse() -> None:
 
     assert len(pp.prod) == 2
     assert len(pp.rules) == 2
+    assert pp.rule_strs == ("1", "2")
 
     assert isinstance(pp.score, float)
 
@@ -29,6 +30,8 @@ def test_partial_parse() -> None:
     )
 
     assert pp != pp2
+    assert pp2 is not None
+    assert pp2.rule_strs == ("1", "2", "mock_rule")
 
     with pytest.raises(ValueError):
         PartialParse((), ())
@@ -13,3 +13,10 @@ def test_parse_years_ahead():
     result = ctparse.ctparse("3 March 2023", ts=datetime(2020, 2, 25))
     assert result
     assert str(result.resolution) == "2023-03-03 X:X (X/X)"
+
+
+def test_ctparse_gen_rule_order():
+    # Some rules modify artifacts of other partial parses in place, productions
+    # must be deduplicated right after each rule application to emit this
+    results = ctparse.ctparse_gen("16-12-13", ts=datetime(2016, 11, 15, 15, 3))
+    assert "X-X-16 X:X (X/X)" in {str(r.resolution) for r in results if r}
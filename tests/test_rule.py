@@ -42,3 +42,31 @@ class TestRule(TestCase):
     def test_predicate(self):
         self.assertTrue(predicate("predA")(TestClassA()))
         self.assertFalse(predicate("predA")(TestClassB()))
+
+    def test_rule_keeps_function_name(self):
+        from ctparse.rule import rules
+
+        self.assertEqual(rules["ruleNamedDOW"][0].__name__, "ruleNamedDOW")
+        self.assertEqual(rules["ruleNamedDOW"][0].__qualname__, "ruleNamedDOW")
+
+    def test_required_literals(self):
+        from ctparse.rule import _required_literals
+
+        self.assertEqual(
+            _required_literals(r"gestern|yesterdays?"), {"gestern", "yesterday"}
+        )
+        self.assertEqual(_required_literals(r"(in)\s*\d+"), {"in"})
+        self.assertEqual(_required_literals(r"\bÜbermorgen\b"), {"übermorgen"})
+        # optional parts and regex module specific syntax give no literals
+        self.assertIsNone(_required_literals(r"(ab)?\d+"))
+        self.assertIsNone(_required_literals(r"(?P<day>(?&_day))"))
+        # syntax re would silently read differently than the regex module
+        self.assertIsNone(_required_literals(r"(?:morgen){e<=1}"))
+        self.assertIsNone(_required_literals(r"[[a-z]--[aeiou]]x"))
+        self.assertIsNone(_required_literals(r"[a&&b]xy"))
+        self.assertIsNone(_required_literals(r"[a||b]xy"))
+        self.assertIsNone(_required_literals(r"[a~~b]xy"))
+        self.assertIsNone(_required_literals(r"[ab[]x"))
+        # plain repeats and sets are fine
+        self.assertEqual(_required_literals(r"\d{2,4}uhr"), {"uhr"})
+        self.assertEqual(_required_literals(r"[-/]bis"), {"bis"})
@@ -2,6 +2,9 @@ import datetime
 import random
 import bz2
 import pickle
+from typing import Tuple
+
+import pytest
 
 from ctparse.nb_scorer import NaiveBayesScorer, train_naive_bayes, save_naive_bayes
 from ctparse.partial_parse import PartialParse
@@ -11,6 +14,18 @@ from ctparse.nb_estimator import MultinomialNaiveBayes
 from ctparse.pipeline import CTParsePipeline
 from ctparse.types import Interval, Time
 
+# Training data for the naive bayes scorer tests
+X_train = [("a", "b"), ("a",), ("b",), ("a", "b", "a", "b")]
+y_train = [False, True, True, False]
+
+
+def make_pp(rules: Tuple[str, ...] = ("a", "b")) -> PartialParse:
+    """A partial parse covering the first two characters of the text"""
+    pp = PartialParse((Time(), Interval()), rules)
+    pp.prod[0].mstart = 0
+    pp.prod[1].mend = 2
+    return pp
+
 
 def test_dummy():
     scorer = DummyScorer()
@@ -69,7 +84,119 @@ def test_naive_bayes_from_file(tmp_path):
     assert nb
 
 
+def test_naive_bayes_from_file_old_scorer(tmp_path):
+    # Scorers pickled by older versions only carry the pipeline
+    old = NaiveBayesScorer.__new__(NaiveBayesScorer)
+    old._model = train_naive_bayes(X_train, y_train)
+    path = tmp_path / "model.pkl"
+    with bz2.open(path, "w") as f:
+        pickle.dump(old, f)
+
+    nb = NaiveBayesScorer.from_model_file(path)
+    ts = datetime.datetime(2019, 1, 1)
+    ref = NaiveBayesScorer(old._model).score("ab", ts, make_pp())
+    assert nb.score("ab", ts, make_pp()) == ref
+
+
 def test_save_naive_bayes(tmp_path):
     path = tmp_path / "model.pkl"
     model = CTParsePipeline(CountVectorizer((1, 1)), MultinomialNaiveBayes())
     save_naive_bayes(model, path)
+
+
+def test_nbscorer_matches_pipeline():
+    model = train_naive_bayes(X_train, y_train)
+    scorer = NaiveBayesScorer(model)
+
+    for x in X_train + [("a", "c", "b"), ("c",)]:
+        neg, pos = model.predict_log_proba([x])[0]
+        assert abs(scorer._prior_delta + scorer._score_rules(x) - (pos - neg)) < 1e-9
+
+
+def test_nbscorer_score_final_reuses_model_score():
+    scorer = NaiveBayesScorer(train_naive_bayes(X_train, y_train))
+    ts = datetime.datetime(2019, 1, 1)
+
+    pp = make_pp()
+    scorer.score("ab", ts, pp)
+    assert pp.nb_logodds is not None
+    assert scorer.score_final("ab", ts, pp, pp.prod[1]) == scorer.score_final(
+        "ab", ts, make_pp(), pp.prod[1]
+    )
+
+
+def test_nbscorer_incremental_score():
+    X = X_train + [("b", "mock_rule")]
+    y = y_train + [True]
+    scorer = NaiveBayesScorer(train_naive_bayes(X, y))
+    ts = datetime.datetime(2019, 1, 1)
+
+    pp = make_pp()
+    scorer.score("ab", ts, pp)
+
+    pp2 = pp.apply_rule(ts, lambda ts, t: Time(), "mock_rule", (0, 1))
+    assert pp2 is not None
+    assert pp2.parent_nb_logodds == pp.nb_logodds
+    scorer.score("ab", ts, pp2)
+    expected = scorer._score_rules(("a", "b", "mock_rule"))
+    assert pp2.nb_logodds is not None
+    assert abs(pp2.nb_logodds - expected) < 1e-9
+    assert scorer._window_scores[("a", "b", "mock_rule")] == scorer._score_last_rule(
+        ("a", "b", "mock_rule")
+    )
+
+
+def test_nbscorer_cache_is_per_scorer():
+    X = X_train + [("b", "mock_rule")]
+    y = y_train + [True]
+    scorer_a = NaiveBayesScorer(train_naive_bayes(X, y))
+    scorer_b = NaiveBayesScorer(train_naive_bayes(X, [not y_i for y_i in y]))
+    ts = datetime.datetime(2019, 1, 1)
+
+    pp = make_pp()
+    scorer_a.score("ab", ts, pp)
+    assert scorer_b.score("ab", ts, pp) == scorer_b.score("ab", ts, make_pp())
+
+    # the child must not be scored incrementally from another scorer's parent
+    pp = make_pp()
+    scorer_a.score("ab", ts, pp)
+    pp2 = pp.apply_rule(ts, lambda ts, t: Time(), "mock_rule", (0, 1))
+    assert pp2 is not None
+    ref = make_pp(("a", "b", "mock_rule"))
+    assert scorer_b.score("ab", ts, pp2) == pytest.approx(scorer_b.score("ab", ts, ref))
+
+
+@pytest.mark.parametrize("fname", ["model.pbz", "model.zst", "model.pkl"])
+def test_naive_bayes_file_formats(tmp_path, fname):
+    if fname.endswith(".zst"):
+        pytest.importorskip("zstandard")
+    path = tmp_path / fname
+    model = train_naive_bayes([("a", "b"), ("a",)], [False, True])
+    if fname.endswith(".pkl"):
+        with open(path, "wb") as f:
+            pickle.dump(model, f)
+    else:
+        save_naive_bayes(model, path)
+    nb = NaiveBayesScorer.from_model_file(path)
+    assert nb._weights == NaiveBayesScorer(model)._weights
+
+
+def test_score_batch():
+    ts = datetime.datetime(2019, 1, 1)
+    nb_scorer = NaiveBayesScorer(train_naive_bayes(X_train, y_train))
+
+    for scorer in [DummyScorer(), nb_scorer]:
+        batch = scorer.score_batch("abc", ts, [make_pp(x) for x in X_train])
+        assert batch == [scorer.score("abc", ts, make_pp(x)) for x in X_train]
+    assert DummyScorer().score_batch("abc", ts, []) == []
+
+
+def test_nbscorer_matches_pipeline_ngram_range():
+    X = [("a", "b", "c"), ("a",), ("b", "c"), ("a", "b", "a", "b")]
+    y = [-1, 1, 1, -1]
+    model = CTParsePipeline(CountVectorizer((2, 3)), MultinomialNaiveBayes()).fit(X, y)
+    scorer = NaiveBayesScorer(model)
+
+    for x in X + [("a", "b", "c", "a"), ("c",)]:
+        neg, pos = model.predict_log_proba([x])[0]
+        assert abs(scorer._prior_delta + scorer._score_rules(x) - (pos - neg)) < 1e-9
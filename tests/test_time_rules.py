@@ -1,6 +1,9 @@
+from datetime import date, datetime
 from unittest import TestCase
 
-from ctparse.types import Time
+import regex
+
+from ctparse.types import RegexMatch, Time
 from ctparse.time.rules import (
     ruleDateDate,
     ruleDOMDate,
@@ -8,6 +11,12 @@ from ctparse.time.rules import (
     ruleDOYDate,
     ruleQuarterBeforeHH,
     ruleQuarterAfterHH,
+    ruleTODPOD,
+    ruleEOM,
+    ruleEOY,
+    _next_dow,
+    _next_dow_dom,
+    _year_in_three_months,
 )
 
 
@@ -91,3 +100,72 @@ class TestRules(TestCase):
     def test_ruleQuarterAferHH(self):
         t1 = Time(hour=12, minute=1)
         self.assertIsNone(ruleQuarterAfterHH(None, None, t1))
+
+    def test_ruleTODPOD(self):
+        self.assertEqual(
+            ruleTODPOD(None, Time(hour=3, minute=0), Time(POD="verylateevening")),
+            Time(hour=15, minute=0),
+        )
+        self.assertEqual(
+            ruleTODPOD(None, Time(hour=3, minute=0), Time(POD="earlymorning")),
+            Time(hour=3, minute=0),
+        )
+        self.assertIsNone(
+            ruleTODPOD(None, Time(hour=17, minute=0), Time(POD="earlymorning"))
+        )
+
+    def test_next_dow(self):
+        # Wednesday
+        ts = datetime(2020, 1, 1, 12, 30)
+        self.assertEqual(_next_dow(ts, 4), datetime(2020, 1, 3, 12, 30))
+        self.assertEqual(_next_dow(ts, 0), datetime(2020, 1, 6, 12, 30))
+        # same weekday as ts returns next week
+        self.assertEqual(_next_dow(ts, 2), datetime(2020, 1, 8, 12, 30))
+        # across the end of the year
+        self.assertEqual(_next_dow(datetime(2019, 12, 30), 2), datetime(2020, 1, 1))
+
+    def test_year_in_three_months(self):
+        self.assertEqual(_year_in_three_months(datetime(2020, 9, 30)), 2020)
+        self.assertEqual(_year_in_three_months(datetime(2020, 10, 1)), 2021)
+        self.assertEqual(_year_in_three_months(datetime(2020, 12, 31)), 2021)
+
+    def test_ruleEOM(self):
+        m = RegexMatch(1, regex.match("(?P<R1>eom)", "eom"))
+        self.assertEqual(
+            ruleEOM(datetime(2020, 2, 10), m), Time(year=2020, month=2, day=29)
+        )
+        self.assertEqual(
+            ruleEOM(datetime(2019, 2, 10), m), Time(year=2019, month=2, day=28)
+        )
+        self.assertEqual(
+            ruleEOM(datetime(2020, 12, 1), m), Time(year=2020, month=12, day=31)
+        )
+        self.assertEqual(
+            ruleEOM(datetime(2020, 12, 31, 23, 59), m),
+            Time(year=2020, month=12, day=31),
+        )
+
+    def test_ruleEOY(self):
+        m = RegexMatch(1, regex.match("(?P<R1>eoy)", "eoy"))
+        self.assertEqual(
+            ruleEOY(datetime(2020, 2, 29), m), Time(year=2020, month=12, day=31)
+        )
+        self.assertEqual(
+            ruleEOY(datetime(2020, 12, 31, 23, 59), m),
+            Time(year=2020, month=12, day=31),
+        )
+
+    def test_next_dow_dom(self):
+        # Monday 31st: skips all months in between without a 31st or on
+        # another weekday
+        self.assertEqual(_next_dow_dom(datetime(2020, 2, 1), 0, 31), date(2020, 8, 31))
+        # Saturday 29th: 29 February of a leap year
+        self.assertEqual(_next_dow_dom(datetime(2020, 2, 1), 5, 29), date(2020, 2, 29))
+        # Monday 29th: no 29 February in 2021
+        self.assertEqual(_next_dow_dom(datetime(2021, 2, 1), 0, 29), date(2021, 3, 29))
+        # Friday 1st: rolls over into the next year
+        self.assertEqual(_next_dow_dom(datetime(2020, 12, 15), 4, 1), date(2021, 1, 1))
+        # Thursday 31st: ts itself qualifies
+        self.assertEqual(
+            _next_dow_dom(datetime(2020, 12, 31, 10), 3, 31), date(2020, 12, 31)
+        )